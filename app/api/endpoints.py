@@ -6,14 +6,17 @@ from fastapi import APIRouter, BackgroundTasks, Depends, File, HTTPException, Up
 
 from app.api.dependencies import verify_api_key
 from app.api.models import (
-    BulkUploadResponse,
     ChatCompletionRequest,
     ChatCompletionResponse,
     HealthCheckResponse,
+    IngestJobResponse,
 )
 from app.config import settings
+from app.core.embeddings import get_embeddings
+from app.rag.tools import retrieval_cache
+from app.services.answer_cache import answer_cache
 from app.services.chat_service import ChatService
-from app.services.document_service import DocumentService
+from app.services.ingest_job_service import IngestJobService
 from app.utils.logging import logger
 
 router = APIRouter(tags=["AI Chat"])
@@ -54,9 +57,10 @@ async def chat_completions(
 
 @router.post(
     "/documents",
-    response_model=BulkUploadResponse,
+    response_model=IngestJobResponse,
+    status_code=202,
     summary="Upload Documents",
-    description="Upload multiple documents for vectorization and storage in the vector store",
+    description="Queue multiple documents for vectorization and storage in the vector store",
 )
 async def upload_document(
     files: List[UploadFile] = File(
@@ -64,9 +68,44 @@ async def upload_document(
         description="List of files to upload. Supported formats: PDF, DOCX, TXT, CSV",
     ),
 ):
-    """Upload multiple documents, vectorize them and store them in the vector store"""
-    document_service = DocumentService()
-    return await document_service.process_documents(files)
+    """Queue multiple documents for ingestion and return the job immediately"""
+    uploads = [
+        {
+            "filename": file.filename,
+            "content_type": file.content_type,
+            "content": await file.read(),
+        }
+        for file in files
+    ]
+    return IngestJobService().submit(uploads)
+
+
+@router.get(
+    "/documents/jobs/{job_id}",
+    response_model=IngestJobResponse,
+    summary="Get Ingestion Job",
+    description="Report per-file progress and throughput of an ingestion job",
+)
+async def get_ingest_job(job_id: str):
+    """Get the status of an ingestion job"""
+    job = IngestJobService().get_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get(
+    "/cache/stats",
+    summary="Cache Statistics",
+    description="Report hit/miss counters of the in-process caches",
+)
+async def cache_stats(api_key: str = Depends(verify_api_key)):
+    """Cache statistics endpoint."""
+    return {
+        "embeddings": get_embeddings().stats(),
+        "retrieval": retrieval_cache.stats(),
+        "answers": answer_cache.stats(),
+    }
 
 
 @router.get(
@@ -64,8 +64,20 @@ class ChatCompletionResponse(BaseModel):
 
 class DocumentUploadResponse(BaseModel):
     filename: str = Field(..., description="Name of the uploaded file")
-    status: Literal["success", "error"] = Field(..., description="Processing status")
+    status: Literal["queued", "processing", "success", "error"] = Field(
+        ..., description="Processing status"
+    )
     error: Optional[str] = Field(None, description="Error message if processing failed")
+    chunks: Optional[int] = Field(None, description="Number of chunks in the file")
+    embedded_chunks: Optional[int] = Field(
+        None, description="Number of new or changed chunks embedded and inserted"
+    )
+    deleted_chunks: Optional[int] = Field(
+        None, description="Number of previously stored chunks no longer in the file"
+    )
+    chunks_per_second: Optional[float] = Field(
+        None, description="Embedding and insert throughput in chunks per second"
+    )
 
 
 class BulkUploadResponse(BaseModel):
@@ -76,6 +88,29 @@ class BulkUploadResponse(BaseModel):
     )
 
 
+class IngestJobResponse(BaseModel):
+    id: str = Field(..., description="Unique identifier of the ingestion job")
+    status: Literal["queued", "running", "completed"] = Field(
+        ..., description="Overall status of the job"
+    )
+    total_files: int = Field(..., description="Total number of files in the job")
+    processed_files: int = Field(..., description="Number of files processed so far")
+    results: List[DocumentUploadResponse] = Field(
+        ..., description="Progress and results for each file"
+    )
+    chunks: int = Field(..., description="Number of chunks processed so far")
+    chunks_per_second: Optional[float] = Field(
+        None, description="Ingest throughput in chunks per second"
+    )
+    created_at: float = Field(..., description="Unix timestamp of job creation")
+    started_at: Optional[float] = Field(
+        None, description="Unix timestamp of when processing started"
+    )
+    finished_at: Optional[float] = Field(
+        None, description="Unix timestamp of when processing finished"
+    )
+
+
 class HealthCheckResponse(BaseModel):
     status: Literal["ok"] = Field(..., description="API health status")
     timestamp: float = Field(..., description="Current timestamp")
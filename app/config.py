@@ -14,6 +14,9 @@ class Settings(BaseSettings):
     DEEPINFRA_API_TOKEN: str = os.getenv("DEEPINFRA_API_TOKEN", "")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "meta-llama/Llama-3.3-70B-Instruct-Turbo")
     EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "BAAI/bge-base-en-v1.5")
+    EMBEDDING_CACHE_SIZE: int = os.getenv("EMBEDDING_CACHE_SIZE", 2048)
+    EMBEDDING_CACHE_TTL: float = os.getenv("EMBEDDING_CACHE_TTL", 86400)
+    EMBEDDING_CACHE_PATH: str = os.getenv("EMBEDDING_CACHE_PATH", "")
     DEEPINFRA_ENDPOINT_MODELS: str = "https://api.deepinfra.com/v1/openai/models"
     LLM_TEMPERATURE: float = os.getenv("LLM_TEMPERATURE", 0)
     LLM_TOP_P: float = os.getenv("LLM_TOP_P", 0.1)
@@ -21,6 +24,10 @@ class Settings(BaseSettings):
     LLM_PRESENCE_PENALTY: float = os.getenv("LLM_PRESENCE_PENALTY", 0.1)
     LLM_MAX_TOKENS: int = os.getenv("LLM_MAX_TOKENS", 3000)
 
+    # Vector store settings: "milvus" or "local" (in-process NumPy index)
+    VECTOR_BACKEND: str = os.getenv("VECTOR_BACKEND", "milvus")
+    LOCAL_INDEX_PATH: str = os.getenv("LOCAL_INDEX_PATH", "")
+
     # Milvus settings
     MILVUS_URI: str = os.getenv(
         "MILVUS_URI",
@@ -29,6 +36,37 @@ class Settings(BaseSettings):
     MILVUS_TOKEN: str = os.getenv("MILVUS_TOKEN", "")
     MILVUS_COLLECTION: str = os.getenv("MILVUS_COLLECTION", "")
 
+    # Retrieval settings
+    RETRIEVAL_MAX_CONCURRENCY: int = os.getenv("RETRIEVAL_MAX_CONCURRENCY", 8)
+    RETRIEVAL_TIMEOUT: float = os.getenv("RETRIEVAL_TIMEOUT", 10)
+    RETRIEVAL_CACHE_SIZE: int = os.getenv("RETRIEVAL_CACHE_SIZE", 1024)
+    RETRIEVAL_CACHE_TTL: float = os.getenv("RETRIEVAL_CACHE_TTL", 86400)
+
+    # Ingestion settings
+    INGEST_MAX_CONCURRENCY: int = os.getenv("INGEST_MAX_CONCURRENCY", 4)
+    INGEST_PARSE_WORKERS: int = os.getenv("INGEST_PARSE_WORKERS", 2)
+    INGEST_JOB_WORKERS: int = os.getenv("INGEST_JOB_WORKERS", 2)
+    INGEST_JOB_RETENTION: int = os.getenv("INGEST_JOB_RETENTION", 100)
+    TAG_CLASSIFIER_MIN_KEYWORD_HITS: int = os.getenv(
+        "TAG_CLASSIFIER_MIN_KEYWORD_HITS", 3
+    )
+    TAG_CLASSIFIER_MIN_MARGIN: float = os.getenv("TAG_CLASSIFIER_MIN_MARGIN", 0.05)
+    CHUNK_SIZE: int = os.getenv("CHUNK_SIZE", 1500)
+    CHUNK_OVERLAP: int = os.getenv("CHUNK_OVERLAP", 200)
+    CSV_CHUNK_SIZE: int = os.getenv("CSV_CHUNK_SIZE", 1000)
+    EMBEDDING_BATCH_SIZE: int = os.getenv("EMBEDDING_BATCH_SIZE", 64)
+    EMBEDDING_BATCH_CONCURRENCY: int = os.getenv("EMBEDDING_BATCH_CONCURRENCY", 4)
+    EMBEDDING_MAX_RETRIES: int = os.getenv("EMBEDDING_MAX_RETRIES", 3)
+    EMBEDDING_RETRY_BACKOFF: float = os.getenv("EMBEDDING_RETRY_BACKOFF", 1)
+
+    # Answer cache settings
+    ANSWER_CACHE_ENABLED: bool = os.getenv("ANSWER_CACHE_ENABLED", "True").lower() == "true"
+    ANSWER_CACHE_SIZE: int = os.getenv("ANSWER_CACHE_SIZE", 512)
+    ANSWER_CACHE_TTL: float = os.getenv("ANSWER_CACHE_TTL", 3600)
+    ANSWER_CACHE_SIMILARITY_THRESHOLD: float = os.getenv(
+        "ANSWER_CACHE_SIMILARITY_THRESHOLD", 0.97
+    )
+
     # System settings
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
@@ -0,0 +1,38 @@
+from langchain_core.documents import Document
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+from app.config import settings
+
+
+def _pack_rows(docs: list[Document], chunk_size: int) -> list[Document]:
+    """Pack consecutive small row documents into chunks of up to chunk_size."""
+    chunks = []
+    rows = []
+    size = 0
+    for doc in docs:
+        if rows and size + len(doc.page_content) > chunk_size:
+            chunks.append(Document(page_content="\n\n".join(rows)))
+            rows, size = [], 0
+        rows.append(doc.page_content)
+        size += len(doc.page_content) + 2
+    if rows:
+        chunks.append(Document(page_content="\n\n".join(rows)))
+    return chunks
+
+
+def chunk_documents(docs: list[Document], content_type: str) -> list[Document]:
+    """Split loader output into chunks sized for embedding.
+
+    CSV rows are packed together up to CSV_CHUNK_SIZE characters, every other
+    content type is split with CHUNK_SIZE/CHUNK_OVERLAP.
+    """
+    if content_type == "text/csv":
+        return _pack_rows(docs, settings.CSV_CHUNK_SIZE)
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=settings.CHUNK_SIZE,
+        chunk_overlap=settings.CHUNK_OVERLAP,
+    )
+    return [
+        chunk for chunk in splitter.split_documents(docs) if chunk.page_content.strip()
+    ]
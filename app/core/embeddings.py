@@ -1,11 +1,106 @@
+import hashlib
+from array import array
+
+from langchain_core.embeddings import Embeddings
 from langchain_deepinfra import DeepInfraEmbeddings
+
 from app.config import settings
+from app.utils.cache import SQLiteCache, TTLCache
+from app.utils.helpers import normalize_text
 from app.utils.logging import logger
 
+_embeddings = None
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings wrapper caching query vectors in memory and optionally on disk.
+
+    Query vectors are keyed on the normalized text and the model name, so cache
+    hits skip the network round trip entirely. Document embeddings (ingestion)
+    are passed straight through to avoid flushing the query cache.
+    """
+
+    def __init__(self, embeddings: Embeddings, model: str):
+        self.embeddings = embeddings
+        self.model = model
+        self.memory_cache = TTLCache(
+            settings.EMBEDDING_CACHE_SIZE, settings.EMBEDDING_CACHE_TTL
+        )
+        self.disk_cache = (
+            SQLiteCache(settings.EMBEDDING_CACHE_PATH, settings.EMBEDDING_CACHE_TTL)
+            if settings.EMBEDDING_CACHE_PATH
+            else None
+        )
+        self.disk_hits = 0
+
+    def _cache_key(self, text: str) -> str:
+        raw = f"{self.model}\x00{normalize_text(text)}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str):
+        vector = self.memory_cache.get(key)
+        if vector is not None or self.disk_cache is None:
+            return vector
+
+        blob = self.disk_cache.get(key)
+        if blob is None:
+            return None
+
+        vector = array("f", blob).tolist()
+        self.disk_hits += 1
+        self.memory_cache.set(key, vector)
+        return vector
+
+    def _store(self, key: str, vector: list[float]):
+        self.memory_cache.set(key, vector)
+        if self.disk_cache is not None:
+            self.disk_cache.set(key, array("f", vector).tobytes())
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        key = self._cache_key(text)
+        vector = self._lookup(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(text)
+            self._store(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> list[float]:
+        key = self._cache_key(text)
+        vector = self._lookup(key)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(text)
+            self._store(key, vector)
+        return vector
+
+    def stats(self) -> dict:
+        """Return cache hit/miss counters."""
+        memory_stats = self.memory_cache.stats()
+        # Memory misses that were served from disk are still cache hits
+        misses = memory_stats["misses"] - self.disk_hits
+        return {
+            "hits": memory_stats["hits"] + self.disk_hits,
+            "misses": misses,
+            "memory_hits": memory_stats["hits"],
+            "disk_hits": self.disk_hits,
+            "size": memory_stats["size"],
+            "max_size": memory_stats["max_size"],
+            "disk_enabled": self.disk_cache is not None,
+        }
+
+
 def get_embeddings():
     """Initialize and return the embedding model."""
-    logger.info(f"Initializing embedding model: {settings.EMBEDDING_MODEL}")
-    embeddings = DeepInfraEmbeddings(
-        model=settings.EMBEDDING_MODEL,
-    )
-    return embeddings
\ No newline at end of file
+    global _embeddings
+    if _embeddings is None:
+        logger.info(f"Initializing embedding model: {settings.EMBEDDING_MODEL}")
+        _embeddings = CachedEmbeddings(
+            DeepInfraEmbeddings(model=settings.EMBEDDING_MODEL),
+            model=settings.EMBEDDING_MODEL,
+        )
+    return _embeddings
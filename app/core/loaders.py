@@ -0,0 +1,50 @@
+import csv
+import io
+
+import docx2txt
+from langchain_core.documents import Document
+from pypdf import PdfReader
+
+# Parsers read uploaded bytes from memory buffers. They run in the parsing
+# process pool, so keep this module's imports light.
+
+
+def decode_text(content: bytes) -> str:
+    """Decode text content, falling back to latin-1 for non UTF-8 files."""
+    try:
+        return content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return content.decode("latin-1")
+
+
+def parse_pdf(content: bytes) -> list[Document]:
+    """Parse a PDF into one document per page."""
+    reader = PdfReader(io.BytesIO(content))
+    return [
+        Document(page_content=page.extract_text() or "", metadata={"page": i})
+        for i, page in enumerate(reader.pages)
+    ]
+
+
+def parse_docx(content: bytes) -> list[Document]:
+    """Parse a DOCX file into a single document."""
+    return [Document(page_content=docx2txt.process(io.BytesIO(content)) or "")]
+
+
+def parse_txt(content: bytes) -> list[Document]:
+    """Parse a plain text file into a single document."""
+    return [Document(page_content=decode_text(content))]
+
+
+def parse_csv(content: bytes) -> list[Document]:
+    """Parse a CSV file into one document per row, formatted like CSVLoader."""
+    reader = csv.DictReader(io.StringIO(decode_text(content), newline=""))
+    docs = []
+    for i, row in enumerate(reader):
+        page_content = "\n".join(
+            f"{key.strip() if key is not None else key}: "
+            f"{value.strip() if isinstance(value, str) else value}"
+            for key, value in row.items()
+        )
+        docs.append(Document(page_content=page_content, metadata={"row": i}))
+    return docs
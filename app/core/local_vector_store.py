@@ -0,0 +1,386 @@
+import asyncio
+import json
+import math
+import os
+import re
+import shutil
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
+
+from app.core.vector_backends import VectorBackend
+from app.utils.logging import logger
+
+# Lowercase unicode word split, like Milvus' standard BM25 analyzer
+TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Return the indices of the k best finite scores, best first."""
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    candidates = np.flatnonzero(np.isfinite(scores))
+    if len(candidates) > k:
+        part = np.argpartition(-scores[candidates], k - 1)[:k]
+        candidates = candidates[part]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+class LocalVectorStore(VectorBackend):
+    """In-process hybrid index over NumPy arrays.
+
+    Dense vectors are L2-normalized rows searched with a single matrix-vector
+    product, and a BM25 index is kept as term postings. Results are fused like
+    Milvus' hybrid search: each field returns its top k, then a weighted (with
+    Milvus' score normalization) or RRF ranker picks the final k.
+
+    When a path is set the index is persisted as .npy files that are loaded
+    memory-mapped. Each persist writes a new version directory and atomically
+    swaps the CURRENT pointer.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        path: Optional[str] = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+    ):
+        self.embeddings = embeddings
+        self.path = path
+        self.k1 = k1
+        self.b = b
+        self._lock = threading.RLock()
+
+        self.ids: list[str] = []
+        self.texts: list[str] = []
+        self.metadatas: list[dict] = []
+        self.vocab: dict[str, int] = {}
+        self._row_by_id: dict[str, int] = {}
+        self._doc_terms: list[np.ndarray] = []
+        self._doc_tfs: list[np.ndarray] = []
+
+        self._dense = np.zeros((0, 0), dtype=np.float32)
+        self._pending_dense: list[np.ndarray] = []
+        self._postings = None
+        self._tags = None
+        self._dirty = False
+
+        if path:
+            self.load()
+
+    def __len__(self):
+        return len(self.ids)
+
+    # Writes
+
+    def add_embeddings(
+        self,
+        texts: list[str],
+        embeddings: list[list[float]],
+        metadatas: list[dict],
+        ids: list[str],
+    ):
+        """Insert precomputed vectors, replacing chunks with the same id."""
+        vectors = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        with self._lock:
+            existing = [chunk_id for chunk_id in ids if chunk_id in self._row_by_id]
+            if existing:
+                self.delete(existing)
+
+            for text, metadata, chunk_id in zip(texts, metadatas, ids):
+                counts = {}
+                for token in tokenize(text):
+                    term = self.vocab.setdefault(token, len(self.vocab))
+                    counts[term] = counts.get(term, 0) + 1
+                self._row_by_id[chunk_id] = len(self.ids)
+                self.ids.append(chunk_id)
+                self.texts.append(text)
+                self.metadatas.append(dict(metadata or {}))
+                self._doc_terms.append(np.fromiter(counts.keys(), dtype=np.int32))
+                self._doc_tfs.append(np.fromiter(counts.values(), dtype=np.float32))
+
+            self._pending_dense.append(vectors)
+            self._invalidate()
+
+    def delete(self, ids: list[str]):
+        """Delete chunks by id."""
+        with self._lock:
+            drop = {self._row_by_id[i] for i in ids if i in self._row_by_id}
+            if not drop:
+                return
+            keep = np.array(
+                [row for row in range(len(self.ids)) if row not in drop], dtype=np.int64
+            )
+            dense = self._get_dense()
+            self._dense = dense[keep] if len(dense) else dense
+            self.ids = [self.ids[row] for row in keep]
+            self.texts = [self.texts[row] for row in keep]
+            self.metadatas = [self.metadatas[row] for row in keep]
+            self._doc_terms = [self._doc_terms[row] for row in keep]
+            self._doc_tfs = [self._doc_tfs[row] for row in keep]
+            self._row_by_id = {chunk_id: row for row, chunk_id in enumerate(self.ids)}
+            self._invalidate()
+
+    def _invalidate(self):
+        self._postings = None
+        self._tags = None
+        self._dirty = True
+
+    async def aadd_documents(self, documents: list[Document], ids: list[str]):
+        texts = [doc.page_content for doc in documents]
+        vectors = await self.embeddings.aembed_documents(texts)
+        self.add_embeddings(texts, vectors, [doc.metadata for doc in documents], ids)
+
+    async def aget_ids(self, source: str) -> list[str]:
+        with self._lock:
+            return [
+                chunk_id
+                for chunk_id, metadata in zip(self.ids, self.metadatas)
+                if metadata.get("source") == source
+            ]
+
+    async def adelete(self, ids: list[str]):
+        self.delete(ids)
+
+    # Index
+
+    def _get_dense(self) -> np.ndarray:
+        if self._pending_dense:
+            parts = ([self._dense] if len(self._dense) else []) + self._pending_dense
+            self._dense = np.concatenate(parts)
+            self._pending_dense = []
+        return self._dense
+
+    def _get_postings(self):
+        """Build (or reuse) the term-major BM25 postings."""
+        if self._postings is None:
+            lengths = np.array([len(t) for t in self._doc_terms], dtype=np.int64)
+            doc_len = np.array([tfs.sum() for tfs in self._doc_tfs], dtype=np.float32)
+            if lengths.sum():
+                terms = np.concatenate(self._doc_terms)
+                tfs = np.concatenate(self._doc_tfs)
+            else:
+                terms = np.zeros(0, dtype=np.int32)
+                tfs = np.zeros(0, dtype=np.float32)
+            docs = np.repeat(np.arange(len(self._doc_terms)), lengths)
+
+            order = np.argsort(terms, kind="stable")
+            terms, docs, tfs = terms[order], docs[order], tfs[order]
+            term_ptr = np.searchsorted(terms, np.arange(len(self.vocab) + 1))
+            df = np.diff(term_ptr).astype(np.float32)
+            n = len(self._doc_terms)
+            idf = np.log(1 + (n - df + 0.5) / (df + 0.5))
+            avgdl = float(doc_len.mean()) if n else 0.0
+            self._postings = (term_ptr, docs, tfs, idf, doc_len, avgdl)
+        return self._postings
+
+    def _get_tags(self) -> np.ndarray:
+        if self._tags is None:
+            self._tags = np.array(
+                [str(metadata.get("tag")) for metadata in self.metadatas], dtype=object
+            )
+        return self._tags
+
+    def _dense_scores(self, vector: np.ndarray) -> np.ndarray:
+        dense = self._get_dense()
+        if not len(dense):
+            return np.zeros(0, dtype=np.float32)
+        return dense @ vector
+
+    def _bm25_scores(self, query: str) -> np.ndarray:
+        term_ptr, docs, tfs, idf, doc_len, avgdl = self._get_postings()
+        scores = np.zeros(len(self.ids), dtype=np.float32)
+        for token in set(tokenize(query)):
+            term = self.vocab.get(token)
+            if term is None:
+                continue
+            start, end = term_ptr[term], term_ptr[term + 1]
+            if start == end:
+                continue
+            term_docs, term_tfs = docs[start:end], tfs[start:end]
+            norm = self.k1 * (1 - self.b + self.b * doc_len[term_docs] / avgdl)
+            scores[term_docs] += idf[term] * term_tfs * (self.k1 + 1) / (term_tfs + norm)
+        return scores
+
+    # Reads
+
+    def search_by_vector(
+        self,
+        query: str,
+        vector: list[float],
+        k: int = 5,
+        tags: Optional[list[str]] = None,
+        ranker_type: str = "weighted",
+        ranker_params: Optional[dict] = None,
+        return_vectors: bool = False,
+    ) -> list[Document]:
+        """Hybrid search with a precomputed query vector."""
+        ranker_params = ranker_params or {}
+        with self._lock:
+            if not self.ids:
+                return []
+
+            query_vector = _normalize_rows(np.asarray(vector, dtype=np.float32))
+            dense_scores = self._dense_scores(query_vector)
+            sparse_scores = self._bm25_scores(query)
+            # BM25 only returns documents that share at least one term
+            sparse_scores = np.where(sparse_scores > 0, sparse_scores, -np.inf)
+            if tags:
+                mask = np.isin(self._get_tags(), list(tags))
+                dense_scores = np.where(mask, dense_scores, -np.inf)
+                sparse_scores = np.where(mask, sparse_scores, -np.inf)
+
+            dense_top = _top_k(dense_scores, k)
+            sparse_top = _top_k(sparse_scores, k)
+
+            fused = {}
+            if ranker_type == "rrf":
+                rrf_k = ranker_params.get("k", 60)
+                for ranking in (dense_top, sparse_top):
+                    for rank, row in enumerate(ranking):
+                        fused[row] = fused.get(row, 0.0) + 1 / (rrf_k + rank + 1)
+            else:
+                weights = ranker_params.get("weights", [0.5, 0.5])
+                # Milvus normalizes cosine to (1 + x) / 2 and BM25 with arctan
+                for row in dense_top:
+                    fused[row] = weights[0] * (1 + float(dense_scores[row])) / 2
+                for row in sparse_top:
+                    fused[row] = fused.get(row, 0.0) + weights[1] * (
+                        2 * math.atan(float(sparse_scores[row])) / math.pi
+                    )
+
+            rows = sorted(fused, key=fused.get, reverse=True)[:k]
+            dense = self._get_dense()
+            results = []
+            for row in rows:
+                metadata = {**self.metadatas[row], "pk": self.ids[row]}
+                if return_vectors:
+                    metadata["vector"] = dense[row].tolist()
+                results.append(
+                    Document(page_content=self.texts[row], metadata=metadata)
+                )
+            return results
+
+    async def asearch(
+        self,
+        query: str,
+        k: int = 5,
+        tags: Optional[list[str]] = None,
+        ranker_type: str = "weighted",
+        ranker_params: Optional[dict] = None,
+        **kwargs,
+    ) -> list[Document]:
+        vector = await self.embeddings.aembed_query(query)
+        return self.search_by_vector(
+            query,
+            vector,
+            k=k,
+            tags=tags,
+            ranker_type=ranker_type,
+            ranker_params=ranker_params,
+            return_vectors=kwargs.get("return_vectors", False),
+        )
+
+    # Persistence
+
+    def save(self):
+        """Write the index to a new version directory and swap CURRENT to it."""
+        if not self.path:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            dense = self._get_dense()
+            lengths = np.array([len(t) for t in self._doc_terms], dtype=np.int64)
+            doc_ptr = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+            terms = (
+                np.concatenate(self._doc_terms)
+                if lengths.sum()
+                else np.zeros(0, dtype=np.int32)
+            )
+            tfs = (
+                np.concatenate(self._doc_tfs)
+                if lengths.sum()
+                else np.zeros(0, dtype=np.float32)
+            )
+            docs = {
+                "ids": list(self.ids),
+                "texts": list(self.texts),
+                "metadatas": list(self.metadatas),
+                "vocab": dict(self.vocab),
+            }
+            self._dirty = False
+
+        os.makedirs(self.path, exist_ok=True)
+        version = f"v{time.time_ns()}"
+        version_dir = os.path.join(self.path, version)
+        os.makedirs(version_dir)
+        np.save(os.path.join(version_dir, "dense.npy"), dense)
+        np.save(os.path.join(version_dir, "terms.npy"), terms)
+        np.save(os.path.join(version_dir, "tfs.npy"), tfs)
+        np.save(os.path.join(version_dir, "doc_ptr.npy"), doc_ptr)
+        with open(os.path.join(version_dir, "docs.json"), "w") as f:
+            json.dump(docs, f)
+
+        previous = self._read_current()
+        tmp_current = os.path.join(self.path, f"CURRENT.{version}")
+        with open(tmp_current, "w") as f:
+            f.write(version)
+        os.replace(tmp_current, os.path.join(self.path, "CURRENT"))
+        if previous and previous != version:
+            shutil.rmtree(os.path.join(self.path, previous), ignore_errors=True)
+        logger.info(f"Persisted local vector index ({len(docs['ids'])} chunks) to {version_dir}")
+
+    def _read_current(self) -> Optional[str]:
+        try:
+            with open(os.path.join(self.path, "CURRENT")) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def load(self):
+        """Load the current version of the index, memory-mapping the arrays."""
+        version = self._read_current()
+        if version is None:
+            return
+        version_dir = os.path.join(self.path, version)
+        with open(os.path.join(version_dir, "docs.json")) as f:
+            docs = json.load(f)
+        dense = np.load(os.path.join(version_dir, "dense.npy"), mmap_mode="r")
+        terms = np.load(os.path.join(version_dir, "terms.npy"), mmap_mode="r")
+        tfs = np.load(os.path.join(version_dir, "tfs.npy"), mmap_mode="r")
+        doc_ptr = np.load(os.path.join(version_dir, "doc_ptr.npy"))
+
+        with self._lock:
+            self.ids = docs["ids"]
+            self.texts = docs["texts"]
+            self.metadatas = docs["metadatas"]
+            self.vocab = docs["vocab"]
+            self._row_by_id = {chunk_id: row for row, chunk_id in enumerate(self.ids)}
+            self._doc_terms = [
+                terms[doc_ptr[i] : doc_ptr[i + 1]] for i in range(len(self.ids))
+            ]
+            self._doc_tfs = [tfs[doc_ptr[i] : doc_ptr[i + 1]] for i in range(len(self.ids))]
+            self._dense = dense
+            self._pending_dense = []
+            self._invalidate()
+            self._dirty = False
+        logger.info(f"Loaded local vector index ({len(self.ids)} chunks) from {version_dir}")
+
+    async def persist(self):
+        await asyncio.to_thread(self.save)
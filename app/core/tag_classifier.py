@@ -0,0 +1,169 @@
+import re
+
+import numpy as np
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from app.config import settings
+from app.core.embeddings import get_embeddings
+from app.core.llm import get_llm
+from app.utils.logging import logger
+from app.utils.prompts import generate_tag_prompt
+
+TAGS = ("student_thesis", "schedules", "other")
+
+TAG_KEYWORDS = {
+    "student_thesis": (
+        "skripsi",
+        "tugas akhir",
+        "thesis",
+        "abstrak",
+        "abstract",
+        "kata kunci",
+        "keywords",
+        "latar belakang",
+        "rumusan masalah",
+        "tinjauan pustaka",
+        "metodologi penelitian",
+        "metode penelitian",
+        "daftar pustaka",
+        "pembimbing",
+        "hasil penelitian",
+        "kesimpulan",
+    ),
+    "schedules": (
+        "jadwal",
+        "schedule",
+        "senin",
+        "selasa",
+        "rabu",
+        "kamis",
+        "jumat",
+        "sabtu",
+        "ruang",
+        "pukul",
+        "sks",
+        "mata kuliah",
+        "kelas",
+        "dosen pengampu",
+        "semester",
+    ),
+}
+
+TAG_EXEMPLARS = {
+    "student_thesis": (
+        "Skripsi mahasiswa: judul, abstrak, kata kunci, latar belakang dan rumusan masalah penelitian.",
+        "Tugas akhir mahasiswa berisi metode penelitian, hasil penelitian, kesimpulan dan dosen pembimbing.",
+    ),
+    "schedules": (
+        "Jadwal kuliah: hari, jam, ruang, mata kuliah, kelas, SKS dan dosen pengampu.",
+        "Jadwal perkuliahan semester ganjil hari Senin pukul 08.00 di ruang kelas.",
+    ),
+    "other": (
+        "Panduan akademik, peraturan, pengumuman dan informasi umum universitas.",
+        "Informasi pendaftaran, biaya kuliah, beasiswa dan layanan kemahasiswaan.",
+    ),
+}
+
+# Times like 08:00 or 13.30 are a strong structural hint for schedules
+TIME_PATTERN = re.compile(r"\b\d{1,2}[:.]\d{2}\b")
+
+_centroids = None
+
+
+def constrain_tag(text: str) -> str:
+    """Map free-text output onto the known tag set."""
+    text = (text or "").lower()
+    for tag in TAGS:
+        if tag in text:
+            return tag
+    return "other"
+
+
+def _keyword_scores(content: str) -> dict:
+    content = content.lower()
+    scores = {
+        tag: sum(1 for keyword in keywords if keyword in content)
+        for tag, keywords in TAG_KEYWORDS.items()
+    }
+    scores["schedules"] += min(3, len(TIME_PATTERN.findall(content)) // 3)
+    return scores
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+async def _get_centroids() -> tuple[list[str], np.ndarray]:
+    """Embed the exemplars once and return one normalized centroid per tag."""
+    global _centroids
+    if _centroids is None:
+        tags = list(TAG_EXEMPLARS)
+        vectors = await get_embeddings().aembed_documents(
+            [text for tag in tags for text in TAG_EXEMPLARS[tag]]
+        )
+        vectors = _normalize(np.asarray(vectors, dtype=np.float32))
+        centroids = []
+        offset = 0
+        for tag in tags:
+            count = len(TAG_EXEMPLARS[tag])
+            centroids.append(vectors[offset : offset + count].mean(axis=0))
+            offset += count
+        _centroids = (tags, _normalize(np.stack(centroids)))
+    return _centroids
+
+
+async def _classify_by_centroid(texts: list[str]) -> tuple[str, float]:
+    """Return the nearest tag centroid and its margin over the runner-up."""
+    tags, centroids = await _get_centroids()
+    vectors = _normalize(
+        np.asarray(await get_embeddings().aembed_documents(texts), dtype=np.float32)
+    )
+    scores = centroids @ _normalize(vectors.mean(axis=0))
+    order = np.argsort(scores)[::-1]
+    return tags[order[0]], float(scores[order[0]] - scores[order[1]])
+
+
+async def _classify_by_llm(content: str) -> str:
+    llm = get_llm()
+    tag = await llm.ainvoke(
+        [
+            SystemMessage(generate_tag_prompt),
+            HumanMessage(content=content),
+        ]
+    )
+    return constrain_tag(tag.content)
+
+
+async def classify_tag(docs: list) -> str:
+    """Classify documents into one of TAGS.
+
+    Keyword/structure heuristics run first, then nearest-centroid over the
+    chunk embeddings. The LLM is only asked when neither is confident.
+    """
+    num_chunks = min(5, len(docs))
+    texts = [doc.page_content for doc in docs[:num_chunks] if doc.page_content.strip()]
+    content = "\n".join(texts)
+    if not texts:
+        return "other"
+
+    scores = _keyword_scores(content)
+    best, second = sorted(scores, key=scores.get, reverse=True)
+    if (
+        scores[best] >= settings.TAG_CLASSIFIER_MIN_KEYWORD_HITS
+        and scores[best] >= 2 * scores[second]
+    ):
+        logger.info(f"Tag '{best}' from keywords {scores}")
+        return best
+
+    try:
+        tag, margin = await _classify_by_centroid(texts)
+        if margin >= settings.TAG_CLASSIFIER_MIN_MARGIN:
+            logger.info(f"Tag '{tag}' from embedding centroid (margin {margin:.3f})")
+            return tag
+    except Exception as e:
+        logger.warning(f"Embedding tag classification failed: {e}")
+
+    tag = await _classify_by_llm(content)
+    logger.info(f"Tag '{tag}' from LLM fallback")
+    return tag
@@ -0,0 +1,83 @@
+import asyncio
+import json
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from langchain_core.documents import Document
+from langchain_milvus import Milvus
+
+
+class VectorBackend(ABC):
+    """Interface every vector store backend implements.
+
+    Filters are structured (tags, source) rather than backend-specific
+    expressions, so callers never build Milvus expressions themselves.
+    """
+
+    @abstractmethod
+    async def asearch(
+        self,
+        query: str,
+        k: int = 5,
+        tags: Optional[list[str]] = None,
+        ranker_type: str = "weighted",
+        ranker_params: Optional[dict] = None,
+        **kwargs,
+    ) -> list[Document]:
+        """Run a hybrid dense + sparse search."""
+
+    @abstractmethod
+    async def aadd_documents(self, documents: list[Document], ids: list[str]):
+        """Embed and insert documents under the given ids."""
+
+    @abstractmethod
+    async def aget_ids(self, source: str) -> list[str]:
+        """Return the ids of every stored chunk of a source."""
+
+    @abstractmethod
+    async def adelete(self, ids: list[str]):
+        """Delete chunks by id."""
+
+    async def persist(self):
+        """Flush pending writes to durable storage, if the backend needs it."""
+
+
+class MilvusBackend(VectorBackend):
+    """Backend for a remote Milvus/Zilliz collection with BM25 hybrid search."""
+
+    def __init__(self, vector_store: Milvus):
+        self.vector_store = vector_store
+
+    async def asearch(
+        self,
+        query: str,
+        k: int = 5,
+        tags: Optional[list[str]] = None,
+        ranker_type: str = "weighted",
+        ranker_params: Optional[dict] = None,
+        **kwargs,
+    ) -> list[Document]:
+        if tags:
+            kwargs["expr"] = f"tag in {list(tags)}"
+        return await self.vector_store.asimilarity_search(
+            query,
+            k=k,
+            ranker_type=ranker_type,
+            ranker_params=ranker_params or {},
+            **kwargs,
+        )
+
+    async def aadd_documents(self, documents: list[Document], ids: list[str]):
+        self.vector_store.auto_id = False
+        await self.vector_store.aadd_documents(documents, ids=ids)
+
+    async def aget_ids(self, source: str) -> list[str]:
+        return (
+            await asyncio.to_thread(
+                self.vector_store.get_pks, expr=f"source == {json.dumps(source)}"
+            )
+            or []
+        )
+
+    async def adelete(self, ids: list[str]):
+        await self.vector_store.adelete(ids=ids)
@@ -1,19 +1,20 @@
+import asyncio
+import hashlib
+import multiprocessing
 import os
 import tempfile
-from contextlib import asynccontextmanager
-from typing import AsyncGenerator, Callable
-
-from fastapi import UploadFile
-from langchain_community.document_loaders import (
-    CSVLoader,
-    Docx2txtLoader,
-    PyPDFLoader,
-    TextLoader,
-)
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Generator
+
 from langchain_milvus import BM25BuiltInFunction, Milvus
 
 from app.config import settings
 from app.core.embeddings import get_embeddings
+from app.core.local_vector_store import LocalVectorStore
+from app.core.loaders import parse_csv, parse_docx, parse_pdf, parse_txt
+from app.core.vector_backends import MilvusBackend, VectorBackend
 from app.utils.logging import logger
 
 
@@ -27,11 +28,26 @@ class VectorStoreManager:
         return cls._instance
 
     @property
-    def vector_store(self):
+    def vector_store(self) -> VectorBackend:
         if self._vector_store is None:
-            logger.info(f"Initializing Milvus connection at {settings.MILVUS_URI}")
-            embeddings = get_embeddings()
-            self._vector_store = Milvus(
+            self._vector_store = self._create_backend()
+        return self._vector_store
+
+    @vector_store.setter
+    def vector_store(self, backend: VectorBackend):
+        self._vector_store = backend
+
+    def _create_backend(self) -> VectorBackend:
+        embeddings = get_embeddings()
+        if settings.VECTOR_BACKEND == "local":
+            logger.info(
+                f"Initializing local vector index at {settings.LOCAL_INDEX_PATH or 'memory'}"
+            )
+            return LocalVectorStore(embeddings, path=settings.LOCAL_INDEX_PATH or None)
+
+        logger.info(f"Initializing Milvus connection at {settings.MILVUS_URI}")
+        return MilvusBackend(
+            Milvus(
                 embeddings,
                 builtin_function=BM25BuiltInFunction(),
                 vector_field=["dense", "sparse"],
@@ -44,42 +60,178 @@ class VectorStoreManager:
                 enable_dynamic_field=True,
                 auto_id=True,
             )
-        return self._vector_store
+        )
 
 
-def get_vector_store():
-    """Initialize and return the vector store."""
+def get_vector_store() -> VectorBackend:
+    """Initialize and return the vector store backend."""
     return VectorStoreManager().vector_store
 
 
-async def add_documents_to_vector_store(documents: list, hash: str, tag: str):
-    """Add documents to the vector store."""
+# Bumped on every ingest so cached retrieval results never outlive the data
+_collection_generation = 0
+
+
+def get_collection_generation() -> int:
+    """Return the current collection generation."""
+    return _collection_generation
+
+
+def bump_collection_generation() -> int:
+    """Mark the collection as changed and return the new generation."""
+    global _collection_generation
+    _collection_generation += 1
+    return _collection_generation
+
+
+# Bounds the number of in-flight searches per worker
+_search_semaphore = asyncio.Semaphore(settings.RETRIEVAL_MAX_CONCURRENCY)
+
+
+async def search_vector_store(query: str, **search_kwargs) -> list:
+    """Run an async similarity search with concurrency limit and timeout."""
+    vector_store = get_vector_store()
+    async with _search_semaphore:
+        try:
+            return await asyncio.wait_for(
+                vector_store.asearch(query, **search_kwargs),
+                timeout=settings.RETRIEVAL_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Vector store search timed out after {settings.RETRIEVAL_TIMEOUT}s for query: {query}"
+            )
+            raise
+
+
+async def _insert_batch(vector_store: VectorBackend, documents: list, ids: list[str]):
+    """Embed and insert one batch, retrying with exponential backoff."""
+    for attempt in range(settings.EMBEDDING_MAX_RETRIES + 1):
+        try:
+            await vector_store.aadd_documents(documents, ids=ids)
+            return
+        except Exception as e:
+            if attempt == settings.EMBEDDING_MAX_RETRIES:
+                raise
+            delay = settings.EMBEDDING_RETRY_BACKOFF * 2**attempt
+            logger.warning(
+                f"Batch insert failed ({e}), retrying in {delay}s "
+                f"({attempt + 1}/{settings.EMBEDDING_MAX_RETRIES})"
+            )
+            await asyncio.sleep(delay)
+
+
+def get_chunk_id(namespace: str, content: str) -> str:
+    """Build a content-hash id for a chunk of the given source."""
+    return hashlib.sha256(f"{namespace}\x00{content}".encode("utf-8")).hexdigest()
+
+
+async def add_documents_to_vector_store(
+    documents: list, hash: str, tag: str, source: str = None
+) -> dict:
+    """Sync the chunks of a source into the vector store and return ingest statistics.
+
+    Chunk ids are content hashes, so re-uploading a source only embeds the
+    new or changed chunks and deletes the chunks that are no longer present.
+    Sources without a name fall back to the file hash.
+    """
     try:
         logger.info(f"Adding {len(documents)} documents to vector store...")
-        # check if hashes are already in the vector store
-        hashes = [hash + f"_{i}" for i in range(len(documents))]
+        start_time = time.perf_counter()
+        namespace = source or hash
         vector_store = get_vector_store()
-        existing_hashes = vector_store.get_pks(
-            expr=f"pk in {hashes}",
-        )
-        if existing_hashes:
-            raise ValueError("Hashes already in the vector store")
 
-        # replace metadata with tag
+        # One id per distinct chunk content
+        chunks = {}
         for doc in documents:
-            doc.metadata = {"tag": tag}
+            chunks.setdefault(get_chunk_id(namespace, doc.page_content), doc)
+
+        # Diff against what is already stored for this source
+        existing_ids = set(await vector_store.aget_ids(namespace))
+        new_ids = [chunk_id for chunk_id in chunks if chunk_id not in existing_ids]
+        stale_ids = list(existing_ids - chunks.keys())
+        new_documents = [chunks[chunk_id] for chunk_id in new_ids]
+
+        # replace metadata with tag and source
+        for doc in new_documents:
+            doc.metadata = {"tag": tag, "source": namespace}
+
+        # Embed and insert in batches, several batches in flight at once
+        batch_size = settings.EMBEDDING_BATCH_SIZE
+        semaphore = asyncio.Semaphore(settings.EMBEDDING_BATCH_CONCURRENCY)
 
-        vector_store.auto_id = False
-        await vector_store.aadd_documents(documents, ids=hashes)
-        logger.info("Documents added successfully.")  # Log successful addition
+        async def insert(start: int):
+            async with semaphore:
+                await _insert_batch(
+                    vector_store,
+                    new_documents[start : start + batch_size],
+                    new_ids[start : start + batch_size],
+                )
+
+        await asyncio.gather(
+            *(insert(start) for start in range(0, len(new_documents), batch_size))
+        )
+        if stale_ids:
+            await vector_store.adelete(ids=stale_ids)
+        if new_ids or stale_ids:
+            await vector_store.persist()
+            bump_collection_generation()
+
+        elapsed = time.perf_counter() - start_time
+        chunks_per_second = len(chunks) / elapsed if elapsed > 0 else 0.0
+        logger.info(
+            f"Documents synced successfully: {len(chunks)} chunks, "
+            f"{len(new_ids)} embedded, {len(stale_ids)} deleted in "
+            f"{elapsed:.2f}s ({chunks_per_second:.1f} chunks/s)"
+        )
+        return {
+            "chunks": len(chunks),
+            "embedded_chunks": len(new_ids),
+            "deleted_chunks": len(stale_ids),
+            "chunks_per_second": chunks_per_second,
+        }
 
     except Exception as e:
         logger.error(f"Error adding documents to vector store: {e}")
         raise e
 
 
-@asynccontextmanager
-async def temporary_file(content: bytes, suffix: str) -> AsyncGenerator[str, None]:
+# Parsers run in a process pool so parsing never blocks the event loop
+_parse_executor = None
+
+
+def get_parse_executor():
+    """Return the shared process pool used for document parsing, if enabled."""
+    global _parse_executor
+    if _parse_executor is None and settings.INGEST_PARSE_WORKERS > 0:
+        _parse_executor = ProcessPoolExecutor(
+            max_workers=settings.INGEST_PARSE_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _parse_executor
+
+
+def shutdown_parse_executor():
+    """Shut down the parsing process pool."""
+    global _parse_executor
+    if _parse_executor is not None:
+        _parse_executor.shutdown(wait=False, cancel_futures=True)
+        _parse_executor = None
+
+
+async def parse_content(parser: Callable, content: bytes) -> list:
+    """Parse bytes content in memory with a given parser."""
+    try:
+        loop = asyncio.get_running_loop()
+        # Without a process pool, fall back to the default thread pool
+        return await loop.run_in_executor(get_parse_executor(), parser, content)
+    except Exception as e:
+        logger.error(f"Error processing file: {e}")
+        raise e
+
+
+@contextmanager
+def temporary_file(content: bytes, suffix: str) -> Generator[str, None, None]:
     """Context manager for handling temporary files from bytes content."""
     with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp_file:
         tmp_file.write(content)
@@ -91,14 +243,25 @@ async def temporary_file(content: bytes, suffix: str) -> AsyncGenerator[str, Non
         os.remove(temp_path)
 
 
+def load_file_with_loader(content: bytes, suffix: str, loader_class: Callable) -> list:
+    """Load bytes content with a path-based loader (runs in a worker process)."""
+    with temporary_file(content, suffix) as temp_path:
+        loader = loader_class(temp_path)
+        return loader.load()
+
+
 async def process_file_with_loader(
-    file: UploadFile, suffix: str, loader_class: Callable
+    content: bytes, suffix: str, loader_class: Callable
 ) -> list:
-    """Generic function to process files with a given loader."""
+    """Process files with a loader that can only read from a path.
+
+    Only use this for formats without an in-memory parser.
+    """
     try:
-        async with temporary_file(file, suffix) as temp_path:
-            loader = loader_class(temp_path)
-            return loader.load()
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            get_parse_executor(), load_file_with_loader, content, suffix, loader_class
+        )
     except Exception as e:
         logger.error(f"Error processing file: {e}")
         raise e
@@ -106,19 +269,19 @@ async def process_file_with_loader(
 
 async def get_vector_from_pdf(content: bytes):
     """Get the vector from the pdf file."""
-    return await process_file_with_loader(content, ".pdf", PyPDFLoader)
+    return await parse_content(parse_pdf, content)
 
 
 async def get_vector_from_docx(content: bytes):
     """Get the vector from the docx file."""
-    return await process_file_with_loader(content, ".docx", Docx2txtLoader)
+    return await parse_content(parse_docx, content)
 
 
 async def get_vector_from_txt(content: bytes):
     """Get the vector from the txt file."""
-    return await process_file_with_loader(content, ".txt", TextLoader)
+    return await parse_content(parse_txt, content)
 
 
 async def get_vector_from_csv(content: bytes):
     """Get the vector from the csv file."""
-    return await process_file_with_loader(content, ".csv", CSVLoader)
+    return await parse_content(parse_csv, content)
@@ -7,6 +7,8 @@ from fastapi.responses import JSONResponse
 
 from app.api.endpoints import router as api_router
 from app.config import settings
+from app.core.vector_store import shutdown_parse_executor
+from app.services.ingest_job_service import IngestJobService
 from app.utils.logging import logger
 
 # Initialize FastAPI app
@@ -88,12 +90,15 @@ async def root():
 @app.on_event("startup")
 async def startup_event():
     logger.info("Starting University RAG API")
+    IngestJobService().start()
 
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down University RAG API")
+    await IngestJobService().stop()
+    shutdown_parse_executor()
 
 
 # Run the app if executed directly
@@ -1,8 +1,21 @@
-from app.core.vector_store import get_vector_store
+import json
+
+from app.config import settings
+from app.core.vector_store import get_collection_generation, search_vector_store
+from app.utils.cache import TTLCache
 from app.utils.logging import logger
 
+# Serialized results keyed on collection generation and search parameters
+retrieval_cache = TTLCache(settings.RETRIEVAL_CACHE_SIZE, settings.RETRIEVAL_CACHE_TTL)
+
+
+def _retrieval_cache_key(query: str, search_kwargs: dict) -> str:
+    return json.dumps(
+        [get_collection_generation(), query, search_kwargs], sort_keys=True
+    )
 
-def retrieve_university_data(query: str, tags: list[str]):
+
+async def retrieve_university_data(query: str, tags: list[str]):
     """
     Retrieve university data from given query and tags.
     Tags can be one or more of the following, if not fit any of them, it will be ignored:
@@ -19,8 +32,6 @@ def retrieve_university_data(query: str, tags: list[str]):
     """
     logger.info(f"Retrieving university data for query: {query} and tags: {tags}")
 
-    vector_store = get_vector_store()
-
     # Set up search parameters
     search_kwargs = {
         "k": 5,
@@ -30,15 +41,22 @@ def retrieve_university_data(query: str, tags: list[str]):
 
     # Only add filter expression if tags are provided
     if tags and len(tags) > 0 and "other" not in tags:
-        search_kwargs["expr"] = f"tag in {tags}"
+        search_kwargs["tags"] = sorted(tags)
+
+    cache_key = _retrieval_cache_key(query, search_kwargs)
+    cached = retrieval_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Serving retrieval result from cache")
+        return cached
 
-    retrieved_docs = vector_store.similarity_search(query, **search_kwargs)
+    retrieved_docs = await search_vector_store(query, **search_kwargs)
 
     serialized = "\n\n".join(
         (f"Source: {doc.metadata.get('source')}\nContent: {doc.page_content}")
         for doc in retrieved_docs
     )
 
+    retrieval_cache.set(cache_key, (serialized, retrieved_docs))
     return serialized, retrieved_docs
 
 
@@ -0,0 +1,99 @@
+from typing import Optional
+
+import numpy as np
+
+from app.config import settings
+from app.core.embeddings import get_embeddings
+from app.utils.cache import TTLCache
+from app.utils.helpers import normalize_text
+from app.utils.logging import logger
+
+
+class AnswerCache:
+    """Semantic cache of final answers to single-turn questions.
+
+    Lookups first try the normalized question verbatim, then fall back to the
+    most similar cached question whose embedding clears the similarity
+    threshold. Every entry is dropped when new documents are ingested.
+    """
+
+    def __init__(self, max_size: int, ttl: float, similarity_threshold: float):
+        self.entries = TTLCache(max_size, ttl)
+        self.similarity_threshold = float(similarity_threshold)
+        self.semantic_hits = 0
+        # Bumped on invalidation so answers computed before it are not stored
+        self.generation = 0
+
+    @staticmethod
+    def get_question(messages) -> Optional[str]:
+        """Return the question if the conversation is single-turn, else None."""
+        if len(messages) != 1 or messages[0].role != "user":
+            return None
+        question = messages[0].content
+        return question if normalize_text(question) else None
+
+    async def _embed(self, question: str) -> np.ndarray:
+        vector = np.asarray(
+            await get_embeddings().aembed_query(question), dtype=np.float32
+        )
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    async def aget(self, question: str) -> Optional[str]:
+        """Return a cached answer for the question, if any."""
+        if not settings.ANSWER_CACHE_ENABLED:
+            return None
+        try:
+            entry = self.entries.get(normalize_text(question))
+            if entry is not None:
+                return entry[1]
+
+            candidates = self.entries.items()
+            if not candidates or self.similarity_threshold >= 1:
+                return None
+
+            vector = await self._embed(question)
+            matrix = np.stack([cached_vector for _, (cached_vector, _) in candidates])
+            scores = matrix @ vector
+            best = int(np.argmax(scores))
+            if scores[best] < self.similarity_threshold:
+                return None
+
+            self.semantic_hits += 1
+            logger.info(
+                f"Answer cache semantic hit ({scores[best]:.3f}) for: {question}"
+            )
+            return candidates[best][1][1]
+        except Exception as e:
+            logger.warning(f"Answer cache lookup failed: {e}")
+            return None
+
+    async def aset(self, question: str, answer: str, generation: int):
+        """Cache an answer computed while the cache was at the given generation."""
+        if not settings.ANSWER_CACHE_ENABLED or not answer:
+            return
+        if generation != self.generation:
+            return
+        try:
+            vector = await self._embed(question)
+            if generation == self.generation:
+                self.entries.set(normalize_text(question), (vector, answer))
+        except Exception as e:
+            logger.warning(f"Answer cache store failed: {e}")
+
+    def invalidate(self):
+        """Drop every cached answer."""
+        self.generation += 1
+        self.entries.clear()
+        logger.info("Answer cache invalidated")
+
+    def stats(self) -> dict:
+        """Return hit/miss counters."""
+        return {**self.entries.stats(), "semantic_hits": self.semantic_hits}
+
+
+answer_cache = AnswerCache(
+    max_size=settings.ANSWER_CACHE_SIZE,
+    ttl=settings.ANSWER_CACHE_TTL,
+    similarity_threshold=settings.ANSWER_CACHE_SIMILARITY_THRESHOLD,
+)
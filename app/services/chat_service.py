@@ -5,6 +5,7 @@ from fastapi.responses import StreamingResponse
 
 from app.api.models import ChatCompletionRequest
 from app.rag.graph import rag_graph
+from app.services.answer_cache import answer_cache
 from app.utils.helpers import (
     convert_to_langgraph_messages,
     create_openai_response,
@@ -29,27 +30,42 @@ class ChatService:
     async def _stream_chat_response(self, request: ChatCompletionRequest):
         """Stream chat response in OpenAI SSE format."""
         try:
-            # Convert messages to LangGraph format
-            input_messages = convert_to_langgraph_messages(request.messages)
+            question = answer_cache.get_question(request.messages)
+            cached_answer = await answer_cache.aget(question) if question else None
 
             # Send the first chunk with role
             first_chunk = format_sse_chunk(model=request.model, role="assistant")
             yield f"data: {json.dumps(first_chunk)}\n\n"
 
-            # Stream the content
-            async for message, metadata in rag_graph.astream(
-                {"messages": input_messages},
-                stream_mode="messages",
-            ):
-                if (
-                    hasattr(message, "content")
-                    and message.content
-                    and message.type != "tool"
+            if cached_answer is not None:
+                chunk = format_sse_chunk(model=request.model, content=cached_answer)
+                yield f"data: {json.dumps(chunk)}\n\n"
+            else:
+                # Convert messages to LangGraph format
+                input_messages = convert_to_langgraph_messages(request.messages)
+                cache_generation = answer_cache.generation
+                streamed_content = []
+
+                # Stream the content
+                async for message, metadata in rag_graph.astream(
+                    {"messages": input_messages},
+                    stream_mode="messages",
                 ):
-                    chunk = format_sse_chunk(
-                        model=request.model, content=message.content
+                    if (
+                        hasattr(message, "content")
+                        and message.content
+                        and message.type != "tool"
+                    ):
+                        streamed_content.append(message.content)
+                        chunk = format_sse_chunk(
+                            model=request.model, content=message.content
+                        )
+                        yield f"data: {json.dumps(chunk)}\n\n"
+
+                if question:
+                    await answer_cache.aset(
+                        question, "".join(streamed_content), cache_generation
                     )
-                    yield f"data: {json.dumps(chunk)}\n\n"
 
             # Final chunk
             final_chunk = format_sse_chunk(model=request.model, finish_reason="stop")
@@ -67,15 +83,25 @@ class ChatService:
     async def _direct_chat_response(self, request: ChatCompletionRequest):
         """Direct chat response."""
         try:
-            # Convert messages to LangGraph format
-            input_messages = convert_to_langgraph_messages(request.messages)
+            question = answer_cache.get_question(request.messages)
+            content = await answer_cache.aget(question) if question else None
 
-            # Invoke the graph
-            result = await rag_graph.ainvoke({"messages": input_messages})
+            if content is None:
+                # Convert messages to LangGraph format
+                input_messages = convert_to_langgraph_messages(request.messages)
+                cache_generation = answer_cache.generation
 
-            # Extract the final assistant message
-            final_message = result["messages"][-1]
-            content = final_message.content if hasattr(final_message, "content") else ""
+                # Invoke the graph
+                result = await rag_graph.ainvoke({"messages": input_messages})
+
+                # Extract the final assistant message
+                final_message = result["messages"][-1]
+                content = (
+                    final_message.content if hasattr(final_message, "content") else ""
+                )
+
+                if question:
+                    await answer_cache.aset(question, content, cache_generation)
 
             # Estimate token usage (rough estimation)
             prompt_tokens = sum(
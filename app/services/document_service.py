@@ -1,9 +1,11 @@
+import asyncio
 from typing import List
 
 from fastapi import HTTPException, UploadFile
-from langchain_core.messages import HumanMessage, SystemMessage
 
-from app.core.llm import get_llm
+from app.config import settings
+from app.core.chunking import chunk_documents
+from app.core.tag_classifier import classify_tag
 from app.core.vector_store import (
     add_documents_to_vector_store,
     get_vector_from_csv,
@@ -11,9 +13,13 @@ from app.core.vector_store import (
     get_vector_from_pdf,
     get_vector_from_txt,
 )
+from app.services.answer_cache import answer_cache
 from app.utils.helpers import get_hash_from_bytes, validate_file_type
 from app.utils.logging import logger
-from app.utils.prompts import generate_tag_prompt
+
+# Bounds concurrent tagging and embedding across all uploads on this worker;
+# parsing is bounded separately by the size of the parse process pool
+_ingest_semaphore = asyncio.Semaphore(settings.INGEST_MAX_CONCURRENCY)
 
 
 class DocumentService:
@@ -28,15 +34,16 @@ class DocumentService:
     async def process_documents(self, files: List[UploadFile]) -> dict:
         """Upload multiple documents, vectorize them and store them in the vector store"""
         try:
-            results = []
-            for file in files:
-                result = await self._process_single_file(file)
-                results.append(result)
+            # Files go through the pipeline concurrently; gather keeps the
+            # results in upload order
+            results = await asyncio.gather(
+                *(self._process_single_file(file) for file in files)
+            )
 
             return {
                 "status": "completed",
                 "total_files": len(files),
-                "results": results,
+                "results": list(results),
             }
         except Exception as e:
             logger.error(f"Error in bulk upload: {str(e)}", exc_info=True)
@@ -46,22 +53,41 @@ class DocumentService:
         """Process a single file and return its processing result."""
         try:
             validate_file_type(file)
-            logger.info(f"Processing file: {file.filename}")
-            logger.info(file.content_type)
             content = await file.read()
+        except Exception as e:
+            logger.error(f"Error processing file {file.filename}: {str(e)}")
+            return {"filename": file.filename, "status": "error", "error": str(e)}
+
+        return await self.process_content(file.filename, file.content_type, content)
+
+    async def process_content(
+        self, filename: str, content_type: str, content: bytes
+    ) -> dict:
+        """Process the content of an uploaded file and return its processing result."""
+        try:
+            logger.info(f"Processing file: {filename}")
+            logger.info(content_type)
             hash = get_hash_from_bytes(content)
-            docs = await self._get_vector_by_content_type(content, file.content_type)
-            logger.info(f"Extracted {len(docs)} documents from {file.filename}")
-            tag = await self._get_tag_by_document(docs)
-            await add_documents_to_vector_store(docs, hash, tag)
+            docs = await self._get_vector_by_content_type(content, content_type)
+            logger.info(f"Extracted {len(docs)} documents from {filename}")
+            docs = await asyncio.to_thread(chunk_documents, docs, content_type)
+            logger.info(f"Split {filename} into {len(docs)} chunks")
+            async with _ingest_semaphore:
+                tag = await self._get_tag_by_document(docs)
+                stats = await add_documents_to_vector_store(
+                    docs, hash, tag, source=filename
+                )
+            if stats["embedded_chunks"] or stats["deleted_chunks"]:
+                answer_cache.invalidate()
 
             return {
-                "filename": file.filename,
+                "filename": filename,
                 "status": "success",
+                **stats,
             }
         except Exception as e:
-            logger.error(f"Error processing file {file.filename}: {str(e)}")
-            return {"filename": file.filename, "status": "error", "error": str(e)}
+            logger.error(f"Error processing file {filename}: {str(e)}")
+            return {"filename": filename, "status": "error", "error": str(e)}
 
     async def _get_vector_by_content_type(self, content: bytes, content_type: str):
         """Get vector based on file content type."""
@@ -74,13 +100,4 @@ class DocumentService:
 
     async def _get_tag_by_document(self, docs: list):
         """Get tag by document."""
-        num_chunks = min(5, len(docs))
-        content = "\n".join([doc.page_content for doc in docs[:num_chunks]])
-        llm = get_llm()
-        tag = await llm.ainvoke(
-            [
-                SystemMessage(generate_tag_prompt),
-                HumanMessage(content=content),
-            ]
-        )
-        return tag.content
+        return await classify_tag(docs)
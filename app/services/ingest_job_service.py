@@ -0,0 +1,140 @@
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+from app.config import settings
+from app.services.document_service import DocumentService
+from app.utils.logging import logger
+
+
+class IngestJobService:
+    """Queue of document ingestion jobs processed by background workers.
+
+    Each uploaded file is a queue item, so INGEST_JOB_WORKERS bounds how many
+    files are ingested at once on this worker, independently of chat traffic.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(IngestJobService, cls).__new__(cls)
+            cls._instance.jobs = OrderedDict()
+            cls._instance.queue = None
+            cls._instance.workers = []
+        return cls._instance
+
+    def start(self):
+        """Start the worker tasks if they are not running yet."""
+        if self.workers:
+            return
+        self.queue = asyncio.Queue()
+        self.workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(settings.INGEST_JOB_WORKERS)
+        ]
+        logger.info(f"Started {len(self.workers)} ingestion workers")
+
+    async def stop(self):
+        """Cancel the worker tasks."""
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    def submit(self, uploads: list[dict]) -> dict:
+        """Create a job for the uploads and queue its files.
+
+        Each upload is a dict with filename, content_type and content keys.
+        """
+        self.start()
+        job_id = str(uuid.uuid4())
+        job = {
+            "id": job_id,
+            "status": "queued",
+            "total_files": len(uploads),
+            "processed_files": 0,
+            "results": [
+                {"filename": upload["filename"], "status": "queued"}
+                for upload in uploads
+            ],
+            "chunks": 0,
+            "chunks_per_second": None,
+            "created_at": time.time(),
+            "started_at": None,
+            "finished_at": None,
+        }
+        self.jobs[job_id] = job
+        self._evict_finished_jobs()
+
+        if not uploads:
+            job["status"] = "completed"
+            job["finished_at"] = job["created_at"]
+        for index, upload in enumerate(uploads):
+            self.queue.put_nowait((job_id, index, upload))
+
+        logger.info(f"Queued ingestion job {job_id} with {len(uploads)} files")
+        return job
+
+    def get_job(self, job_id: str) -> Optional[dict]:
+        """Return a job by id."""
+        return self.jobs.get(job_id)
+
+    def _evict_finished_jobs(self):
+        finished = [
+            job_id
+            for job_id, job in self.jobs.items()
+            if job["status"] == "completed"
+        ]
+        for job_id in finished[: max(0, len(self.jobs) - settings.INGEST_JOB_RETENTION)]:
+            del self.jobs[job_id]
+
+    async def _worker(self):
+        document_service = DocumentService()
+        while True:
+            job_id, index, upload = await self.queue.get()
+            try:
+                await self._process_file(document_service, job_id, index, upload)
+            except Exception as e:
+                logger.error(f"Ingestion worker error: {e}", exc_info=True)
+            finally:
+                self.queue.task_done()
+
+    async def _process_file(
+        self, document_service: DocumentService, job_id: str, index: int, upload: dict
+    ):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return
+
+        if job["started_at"] is None:
+            job["started_at"] = time.time()
+            job["status"] = "running"
+        job["results"][index]["status"] = "processing"
+
+        try:
+            result = await document_service.process_content(
+                upload["filename"], upload["content_type"], upload["content"]
+            )
+        except Exception as e:
+            result = {"filename": upload["filename"], "status": "error", "error": str(e)}
+        finally:
+            # Release the file bytes as soon as they are processed
+            upload.pop("content", None)
+
+        job["results"][index] = result
+        job["processed_files"] += 1
+        job["chunks"] += result.get("chunks") or 0
+
+        elapsed = time.time() - job["started_at"]
+        if elapsed > 0:
+            job["chunks_per_second"] = job["chunks"] / elapsed
+
+        if job["processed_files"] == job["total_files"]:
+            job["status"] = "completed"
+            job["finished_at"] = time.time()
+            logger.info(
+                f"Ingestion job {job_id} completed: {job['chunks']} chunks in {elapsed:.2f}s"
+            )
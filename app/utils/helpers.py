@@ -1,5 +1,7 @@
 import hashlib
+import re
 import time
+import unicodedata
 import uuid
 
 from fastapi import HTTPException, UploadFile
@@ -19,6 +21,12 @@ def convert_to_langgraph_messages(messages):
     return result
 
 
+def normalize_text(text: str) -> str:
+    """Normalize text for cache keys: unicode form, case and whitespace."""
+    text = unicodedata.normalize("NFKC", text or "")
+    return re.sub(r"\s+", " ", text).strip().casefold()
+
+
 def estimate_tokens(text):
     """Estimate token count from text (rough approximation)."""
     if not text: